@@ -231,12 +231,21 @@ class DeltaGenerator(
         ctx = get_script_run_ctx()
         if ctx:
             ctx.dg_stack.append(self)
+            # Keep track of the innermost form-carrying DeltaGenerator, so that
+            # form lookups don't need to walk the whole dg_stack.
+            if self._form_data is not None:
+                ctx.form_dg_stack.append(self)
+            elif len(ctx.form_dg_stack) > 0:
+                ctx.form_dg_stack.append(ctx.form_dg_stack[-1])
+            else:
+                ctx.form_dg_stack.append(None)
 
     def __exit__(self, type, value, traceback):
         # with block ended
         ctx = get_script_run_ctx()
         if ctx is not None:
             ctx.dg_stack.pop()
+            ctx.form_dg_stack.pop()
 
         # Re-raise any exceptions
         return False
@@ -303,17 +303,20 @@ class ButtonMixin:
             check_callback_rules(self.dg, on_click)
         check_session_state_rules(default_value=None, key=key, writes_allowed=False)
 
+        # Look up our form once; an empty form_id means we're not in a form.
+        form_id = current_form_id(self.dg)
+
         # It doesn't make sense to create a button inside a form (except
         # for the "Form Submitter" button that's automatically created in
         # every form). We throw an error to warn the user about this.
         # We omit this check for scripts running outside streamlit, because
         # they will have no script_run_ctx.
         if streamlit._is_running_with_streamlit:
-            if is_in_form(self.dg) and not is_form_submitter:
+            if form_id != "" and not is_form_submitter:
                 raise StreamlitAPIException(
                     f"`st.button()` can't be used in an `st.form()`.{FORM_DOCS_INFO}"
                 )
-            elif not is_in_form(self.dg) and is_form_submitter:
+            elif form_id == "" and is_form_submitter:
                 raise StreamlitAPIException(
                     f"`st.form_submit_button()` must be used inside an `st.form()`.{FORM_DOCS_INFO}"
                 )
@@ -322,7 +325,7 @@ class ButtonMixin:
         button_proto.label = label
         button_proto.default = False
         button_proto.is_form_submitter = is_form_submitter
-        button_proto.form_id = current_form_id(self.dg)
+        button_proto.form_id = form_id
         button_proto.disabled = disabled
         if help is not None:
             button_proto.help = dedent(help)
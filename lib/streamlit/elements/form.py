@@ -12,8 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import textwrap
-from typing import cast, Optional, NamedTuple
+from typing import cast, Optional
+
+import attr
 
 import streamlit
 from streamlit.errors import StreamlitAPIException
@@ -21,7 +22,8 @@ from streamlit.proto import Block_pb2
 from streamlit.scriptrunner import ScriptRunContext, get_script_run_ctx
 
 
-class FormData(NamedTuple):
+@attr.s(auto_attribs=True, slots=True, frozen=True)
+class FormData:
     """Form data stored on a DeltaGenerator."""
 
     # The form's unique ID.
@@ -34,8 +36,9 @@ def _current_form(
     """Find the FormData for the given DeltaGenerator.
 
     Forms are blocks, and can have other blocks nested inside them.
-    To find the current form, we walk up the dg_stack until we find
-    a DeltaGenerator that has FormData.
+    To find the current form, we look up the innermost DeltaGenerator in
+    the dg_stack that has FormData. (The ScriptRunContext tracks this in
+    its form_dg_stack, so we don't need to walk the dg_stack ourselves.)
     """
     if not streamlit._is_running_with_streamlit:
         return None
@@ -43,16 +46,18 @@ def _current_form(
     if this_dg._form_data is not None:
         return this_dg._form_data
 
-    if this_dg == this_dg._main_dg:
+    # `this_dg._parent is None` is equivalent to `this_dg == this_dg._main_dg`,
+    # without recursing up the parent chain.
+    if this_dg._parent is None:
         # We were created via an `st.foo` call.
-        # Walk up the dg_stack to see if we're nested inside a `with st.form` statement.
+        # Check the dg_stack to see if we're nested inside a `with st.form` statement.
         ctx = get_script_run_ctx()
-        if ctx is None or len(ctx.dg_stack) == 0:
+        if ctx is None or len(ctx.form_dg_stack) == 0:
             return None
 
-        for dg in reversed(ctx.dg_stack):
-            if dg._form_data is not None:
-                return dg._form_data
+        form_dg = ctx.form_dg_stack[-1]
+        if form_dg is not None:
+            return form_dg._form_data
     else:
         # We were created via an `dg.foo` call.
         # Take a look at our parent's form data to see if we're nested inside a form.
@@ -78,34 +83,33 @@ def current_form_id(dg: "streamlit.delta_generator.DeltaGenerator") -> str:
 
 def is_in_form(dg: "streamlit.delta_generator.DeltaGenerator") -> bool:
     """True if the DeltaGenerator is inside an st.form block."""
-    return current_form_id(dg) != ""
-
+    form_data = _current_form(dg)
+    return form_data is not None and form_data.form_id != ""
 
-def _build_duplicate_form_message(user_key: Optional[str] = None) -> str:
-    if user_key is not None:
-        message = textwrap.dedent(
-            f"""
-            There are multiple identical forms with `key='{user_key}'`.
 
-            To fix this, please make sure that the `key` argument is unique for
-            each `st.form` you create.
-            """
-        )
-    else:
-        message = textwrap.dedent(
-            """
-            There are multiple identical forms with the same generated key.
+_DUPLICATE_FORM_KEY_MESSAGE = (
+    "There are multiple identical forms with `key='{user_key}'`.\n"
+    "\n"
+    "To fix this, please make sure that the `key` argument is unique for\n"
+    "each `st.form` you create."
+)
 
-            When a form is created, it's assigned an internal key based on
-            its structure. Multiple forms with an identical structure will
-            result in the same internal key, which causes this error.
+_DUPLICATE_FORM_GENERATED_KEY_MESSAGE = (
+    "There are multiple identical forms with the same generated key.\n"
+    "\n"
+    "When a form is created, it's assigned an internal key based on\n"
+    "its structure. Multiple forms with an identical structure will\n"
+    "result in the same internal key, which causes this error.\n"
+    "\n"
+    "To fix this error, please pass a unique `key` argument to\n"
+    "`st.form`."
+)
 
-            To fix this error, please pass a unique `key` argument to
-            `st.form`.
-            """
-        )
 
-    return message.strip("\n")
+def _build_duplicate_form_message(user_key: Optional[str] = None) -> str:
+    if user_key is not None:
+        return _DUPLICATE_FORM_KEY_MESSAGE.format(user_key=user_key)
+    return _DUPLICATE_FORM_GENERATED_KEY_MESSAGE
 
 
 class FormMixin:
@@ -181,11 +185,9 @@ class FormMixin:
 
         ctx = get_script_run_ctx()
         if ctx is not None:
-            new_form_id = form_id not in ctx.form_ids_this_run
-            if new_form_id:
-                ctx.form_ids_this_run.add(form_id)
-            else:
+            if form_id in ctx.form_ids_this_run:
                 raise StreamlitAPIException(_build_duplicate_form_message(key))
+            ctx.form_ids_this_run.add(form_id)
 
         block_proto = Block_pb2.Block()
         block_proto.form.form_id = form_id
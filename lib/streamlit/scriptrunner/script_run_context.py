@@ -51,6 +51,11 @@ class ScriptRunContext:
     form_ids_this_run: Set[str] = attr.Factory(set)
     cursors: Dict[int, "streamlit.cursor.RunningCursor"] = attr.Factory(dict)
     dg_stack: List["streamlit.delta_generator.DeltaGenerator"] = attr.Factory(list)
+    # Parallel to dg_stack: for each entry, the innermost DeltaGenerator in
+    # dg_stack (up to and including that entry) that has FormData, or None.
+    form_dg_stack: List[
+        Optional["streamlit.delta_generator.DeltaGenerator"]
+    ] = attr.Factory(list)
 
     def reset(self, query_string: str = "") -> None:
         self.cursors = {}
@@ -31,6 +31,7 @@ from streamlit.proto.TextInput_pb2 import TextInput
 from streamlit.proto.Empty_pb2 import Empty as EmptyProto
 from streamlit.proto.RootContainer_pb2 import RootContainer
 from streamlit.proto.Text_pb2 import Text as TextProto
+from streamlit.scriptrunner import get_script_run_ctx
 from streamlit.state.widgets import _build_duplicate_widget_message
 import streamlit.state.widgets as w
 from tests import testutil
@@ -362,6 +363,21 @@ class DeltaGeneratorWithTest(testutil.DeltaGeneratorTestCase):
                 msg.metadata.delta_path,
             )
 
+    def test_with_stacks_unwound_on_exception(self):
+        """dg_stack and form_dg_stack are both unwound when an exception
+        is raised inside a `with` block."""
+        ctx = get_script_run_ctx()
+
+        with self.assertRaises(RuntimeError):
+            with st.form("form"):
+                with st.container():
+                    self.assertEqual(2, len(ctx.dg_stack))
+                    self.assertEqual(2, len(ctx.form_dg_stack))
+                    raise RuntimeError("oops")
+
+        self.assertEqual([], ctx.dg_stack)
+        self.assertEqual([], ctx.form_dg_stack)
+
 
 class DeltaGeneratorWriteTest(testutil.DeltaGeneratorTestCase):
     """Test DeltaGenerator Text, Alert, Json, and Markdown Classes."""
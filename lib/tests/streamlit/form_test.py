@@ -72,6 +72,23 @@ class FormAssociationTest(testutil.DeltaGeneratorTestCase):
                     st.sidebar.checkbox("widget2")
         self.assertEqual(NO_FORM_ID, self._get_last_checkbox_form_id())
 
+    def test_implicit_form_parent_inside_container(self):
+        """An `st.foo` element inside a container that's inside a form
+        belongs to the form."""
+        with st.form("form"):
+            with st.container():
+                st.checkbox("widget")
+        self.assertEqual("form", self._get_last_checkbox_form_id())
+
+    def test_container_created_outside_form(self):
+        """An `st.foo` element inside a container that was created outside
+        a form doesn't belong to the form."""
+        no_form_container = st.container()
+        with st.form("form"):
+            with no_form_container:
+                st.checkbox("widget")
+        self.assertEqual(NO_FORM_ID, self._get_last_checkbox_form_id())
+
     def test_parent_created_inside_form(self):
         """If a parent DG is created inside a form, any children of
         that parent belong to the form."""